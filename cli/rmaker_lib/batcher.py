@@ -0,0 +1,135 @@
+# Copyright 2020 Espressif Systems (Shanghai) PTE LTD
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from rmaker_lib import node
+from rmaker_lib.logger import log
+
+MAX_BATCH = 32
+MAX_WAIT_MS = 10
+
+
+class RequestBatcher:
+    """
+    RequestBatcher class used to coalesce independent node parameter
+    reads/writes into batched REST calls.
+
+    Requests submitted from different callers are queued and drained by
+    a worker thread, which waits a bounded window of MAX_WAIT_MS after
+    the first request (or until MAX_BATCH requests are queued) and then
+    issues one multi-node request per operation. A single queued request
+    simply goes out as a per-node call, so per-call latency stays close
+    to one round-trip.
+
+    :param session: :class:`rmaker_lib.session.Session`
+    :type session: object
+    """
+    def __init__(self, session):
+        """
+        Instantiate batcher with session object and start worker thread.
+        """
+        log.info("Initialising request batcher.")
+        self.__session = session
+        self.__queue = queue.Queue()
+        self.__worker = threading.Thread(target=self.__drain_requests,
+                                         daemon=True)
+        self.__worker.start()
+
+    def submit(self, operation, nodeid, payload=None):
+        """
+        Queue a request for batching.
+
+        :param operation: Operation to be performed, can take values
+                          'get_params' or 'set_params'
+        :type operation: str
+
+        :param nodeid: Node Id of node
+        :type nodeid: str
+
+        :param payload: Parameters to be set for 'set_params' operation
+        :type payload: dict | None
+
+        :return: Future resolving to the operation result
+        :rtype: :class:`concurrent.futures.Future`
+        """
+        future = Future()
+        self.__queue.put((operation, nodeid, payload, future))
+        return future
+
+    def __drain_requests(self):
+        """
+        Drain queued requests in batches and dispatch them.
+
+        Blocks for the first request, then collects requests until
+        MAX_BATCH are queued or MAX_WAIT_MS has passed, and issues one
+        batched call per operation.
+
+        :return: None
+        :rtype: None
+        """
+        while True:
+            batch = [self.__queue.get()]
+            deadline = time.monotonic() + MAX_WAIT_MS / 1000.0
+            while len(batch) < MAX_BATCH:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self.__queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            log.debug("Dispatching batch of " + str(len(batch)) +
+                      " node requests.")
+            self.__dispatch(batch)
+
+    def __dispatch(self, batch):
+        """
+        Dispatch one drained batch and fan results out to the futures.
+
+        :param batch: List of (operation, nodeid, payload, future) tuples
+        :type batch: list
+
+        :return: None
+        :rtype: None
+        """
+        get_requests = [entry for entry in batch if entry[0] == 'get_params']
+        set_requests = [entry for entry in batch if entry[0] == 'set_params']
+        if get_requests:
+            try:
+                node_ids = [nodeid for _, nodeid, _, _ in get_requests]
+                result = node.get_nodes_params(self.__session, node_ids)
+                for _, nodeid, _, future in get_requests:
+                    if nodeid in result:
+                        future.set_result(result[nodeid])
+                    else:
+                        future.set_exception(
+                            Exception('No response received for node : ' +
+                                      nodeid))
+            except Exception as batch_err:
+                for _, _, _, future in get_requests:
+                    future.set_exception(batch_err)
+        if set_requests:
+            try:
+                node_params = {nodeid: payload
+                               for _, nodeid, payload, _ in set_requests}
+                node.set_nodes_params(self.__session, node_params)
+                for _, _, _, future in set_requests:
+                    future.set_result(True)
+            except Exception as batch_err:
+                for _, _, _, future in set_requests:
+                    future.set_exception(batch_err)
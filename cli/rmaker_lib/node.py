@@ -12,12 +12,138 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import logging
+import ssl
 import requests
 import json
+import time
+from urllib.parse import urlencode
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from rmaker_lib import serverconfig, configmanager
 from rmaker_lib.exceptions import NetworkError, InvalidClassInput, SSLError
 from rmaker_lib.logger import log
 
+try:
+    import orjson
+
+    def _dumps(data):
+        return orjson.dumps(data)
+
+    _json_loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _json_loads = json.loads
+
+try:
+    import simdjson
+    _simd_parser = simdjson.Parser()
+except ImportError:
+    _simd_parser = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+def _loads(data):
+    """
+    Parse a JSON response body with the fastest available parser.
+
+    pysimdjson parses in-place over the byte buffer with SIMD when it is
+    installed; the module-level parser is reused across calls so its
+    internal buffers are recycled. orjson (or the stdlib json module) is
+    used otherwise. Feeding bytes skips the str decode either way.
+
+    :param data: JSON body to parse
+    :type data: bytes | str
+
+    :return: Parsed response
+    :rtype: dict | list
+    """
+    if _simd_parser is not None:
+        parsed = _simd_parser.parse(data)
+        if isinstance(parsed, simdjson.Object):
+            return parsed.as_dict()
+        if isinstance(parsed, simdjson.Array):
+            return parsed.as_list()
+        return parsed
+    return _json_loads(data)
+
+
+def _response_value(data, key, default=None):
+    """
+    Get a single top-level value from a JSON response body.
+
+    With pysimdjson the value is read through the lazy document view, so
+    the full payload is never materialized as Python objects just to
+    consult one key. The response is parsed to a dict otherwise.
+
+    :param data: JSON body to read from
+    :type data: bytes | str
+
+    :param key: Top-level key to look up
+    :type key: str
+
+    :param default: Value to return when the key is absent
+    :type default: object
+
+    :return: Value for the key on Success, default otherwise
+    :rtype: object
+    """
+    if _simd_parser is not None:
+        parsed = _simd_parser.parse(data)
+        try:
+            return parsed.at_pointer('/' + key)
+        except (KeyError, TypeError):
+            return default
+    response = _json_loads(data)
+    if key in response:
+        return response[key]
+    return default
+
+
+def _loads_params_response(data):
+    """
+    Parse a params response body, returning None for a failure status.
+
+    With pysimdjson the status check goes through the lazy document
+    view, so a failure response is rejected without materializing the
+    payload; the dict is built only for successful responses.
+
+    :param data: JSON body to parse
+    :type data: bytes | str
+
+    :return: Parsed params on Success, None on failure status
+    :rtype: dict | None
+    """
+    if _simd_parser is not None:
+        parsed = _simd_parser.parse(data)
+        try:
+            if parsed.at_pointer('/status') == 'failure':
+                return None
+        except (KeyError, TypeError):
+            pass
+        if isinstance(parsed, simdjson.Object):
+            return parsed.as_dict()
+        if isinstance(parsed, simdjson.Array):
+            return parsed.as_list()
+        return parsed
+    response = _json_loads(data)
+    if 'status' in response and response['status'] == 'failure':
+        return None
+    return response
+
+
+BATCH_NODEID_LIMIT = 50
+CACHE_TTL = 60
+CACHE_MAXSIZE = 256
+RETRY_POLICY = Retry(total=3, backoff_factor=0.2,
+                     status_forcelist=(502, 503, 504),
+                     allowed_methods=('GET', 'PUT'))
+
 
 class Node:
     """
@@ -30,6 +156,9 @@ class Node:
     :param session: :class:`rmaker_lib.session.Session`
     :type session: object
     """
+    _status_cache = {}
+    _config_cache = {}
+
     def __init__(self, nodeid, session):
         """
         Instantiate node with nodeid and session object.
@@ -37,13 +166,63 @@ class Node:
         log.info("Initialising node with nodeid : " + nodeid)
         self.__nodeid = nodeid
         self.__session = session
-        try:
-            self.__request_header = {'content-type': 'application/json',
-                                     'Authorization': session.id_token}
-        except AttributeError:
+        if not getattr(session, 'id_token', None):
             raise InvalidClassInput(session, 'Invalid Session Input.\
                                               Expected: type <session object>.\
                                               Received: ')
+        self.__http_owned = False
+        self.__http = self.__get_http_session()
+        query_parameters = urlencode({'nodeid': nodeid})
+        self.__urls = {
+            'status': serverconfig.HOST + 'user/nodes/status?' +
+                      query_parameters,
+            'config': serverconfig.HOST + 'user/nodes/config?' +
+                      query_parameters,
+            'params': serverconfig.HOST + 'user/nodes/params?' +
+                      query_parameters,
+            'mapping': serverconfig.HOST + 'user/nodes/mapping'
+        }
+
+    def __get_http_session(self):
+        """
+        Get the HTTP session used for REST calls.
+
+        The session shared by the :class:`rmaker_lib.session.Session`
+        object is preferred so that all nodes of one CLI invocation share
+        a single connection pool. A private session with the same pool
+        settings is created as fallback.
+
+        :return: HTTP session on Success
+        :rtype: :class:`requests.Session`
+        """
+        try:
+            return self.__session.get_http_session()
+        except AttributeError:
+            pass
+        http_session = requests.Session()
+        http_session.mount('https://',
+                           HTTPAdapter(pool_connections=4,
+                                       pool_maxsize=20,
+                                       max_retries=RETRY_POLICY))
+        http_session.headers.update({'content-type': 'application/json',
+                                     'Authorization':
+                                     self.__session.id_token,
+                                     'Accept-Encoding': 'br, gzip, deflate'})
+        http_session.verify = configmanager.CERT_FILE
+        self.__http_owned = True
+        return http_session
+
+    def close(self):
+        """
+        Close the private HTTP session of this node, if it created one.
+        The session shared through :class:`rmaker_lib.session.Session`
+        is left open for the other nodes using its connection pool.
+
+        :return: None on Success
+        :rtype: None
+        """
+        if self.__http_owned:
+            self.__http.close()
 
     def get_nodeid(self):
         """
@@ -54,6 +233,78 @@ class Node:
         """
         return self.__nodeid
 
+    @classmethod
+    def invalidate_cache(cls, nodeid=None):
+        """
+        Invalidate the cached status/config responses.
+
+        :param nodeid: Node Id to invalidate entries for, all entries
+                       are invalidated if not passed
+        :type nodeid: str | None
+
+        :return: None on Success
+        :rtype: None
+        """
+        if nodeid is None:
+            cls._status_cache.clear()
+            cls._config_cache.clear()
+            return
+        cls._status_cache.pop(nodeid, None)
+        cls._config_cache.pop(nodeid, None)
+
+    def __get_cached_response(self, cache):
+        """
+        Get the cached response for this node if it has not expired.
+
+        :param cache: Cache to look up, keyed by nodeid
+        :type cache: dict
+
+        :return: Cached response on hit, None otherwise
+        :rtype: dict | None
+        """
+        entry = cache.get(self.__nodeid)
+        if entry is None:
+            return None
+        response, expiry = entry
+        if time.time() > expiry:
+            cache.pop(self.__nodeid, None)
+            return None
+        return response
+
+    def __store_cached_response(self, cache, response):
+        """
+        Store a response for this node with a CACHE_TTL expiry.
+
+        :param cache: Cache to store into, keyed by nodeid
+        :type cache: dict
+
+        :param response: Parsed response to store
+        :type response: dict
+
+        :return: None on Success
+        :rtype: None
+        """
+        if len(cache) >= CACHE_MAXSIZE:
+            cache.clear()
+        cache[self.__nodeid] = (response, time.time() + CACHE_TTL)
+
+    def __get_batched_response(self, operation):
+        """
+        Get the slice of a batched response for this node, if the caller
+        pre-fetched one with the module-level get_nodes_* helpers.
+
+        :param operation: Operation the response was fetched for, can
+                          take values 'status', 'config' or 'params'
+        :type operation: str
+
+        :return: Response slice on cache hit, None otherwise
+        :rtype: dict | None
+        """
+        batch_cache = getattr(self.__session, '_batch_cache', None)
+        if not batch_cache:
+            return None
+        return batch_cache.get(operation, {}).get(self.__nodeid)
+
     def get_node_status(self):
         """
         Get online/offline status of the node.
@@ -65,26 +316,32 @@ class Node:
         :return: Status of node on Success
         :rtype: dict
         """
+        cached = self.__get_batched_response('status')
+        if cached is None:
+            cached = self.__get_cached_response(self._status_cache)
+        if cached is not None:
+            return cached
         log.info("Getting online/offline status of the node : " +
                  self.__nodeid)
-        path = 'user/nodes/status'
-        query_parameters = 'nodeid=' + self.__nodeid
-        getnodestatus_url = serverconfig.HOST + path + '?' + query_parameters
+        getnodestatus_url = self.__urls['status']
         try:
-            log.debug("Get node status request url : " + getnodestatus_url)
-            response = requests.get(url=getnodestatus_url,
-                                    headers=self.__request_header,
-                                    verify=configmanager.CERT_FILE)
-            log.debug("Get node status response : " + response.text)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Get node status request url : " +
+                          getnodestatus_url)
+            response = self.__http.get(url=getnodestatus_url)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Get node status response : " + response.text)
             response.raise_for_status()
         except requests.exceptions.SSLError:
             raise SSLError
         except requests.exceptions.ConnectionError:
             raise NetworkError
-        except Exception:
-            raise Exception(response.text)
+        except requests.exceptions.HTTPError as http_err:
+            raise Exception(http_err.response.text)
         log.info("Received node status successfully.")
-        return response.json()
+        node_status = _loads(response.content)
+        self.__store_cached_response(self._status_cache, node_status)
+        return node_status
 
     def get_node_config(self):
         """
@@ -97,25 +354,31 @@ class Node:
         :return: Configuration of node on Success
         :rtype: dict
         """
+        cached = self.__get_batched_response('config')
+        if cached is None:
+            cached = self.__get_cached_response(self._config_cache)
+        if cached is not None:
+            return cached
         log.info("Getting node config for node : " + self.__nodeid)
-        path = 'user/nodes/config'
-        query_parameters = 'nodeid=' + self.__nodeid
-        getnodeconfig_url = serverconfig.HOST + path + '?' + query_parameters
+        getnodeconfig_url = self.__urls['config']
         try:
-            log.debug("Get node config request url : " + getnodeconfig_url)
-            response = requests.get(url=getnodeconfig_url,
-                                    headers=self.__request_header,
-                                    verify=configmanager.CERT_FILE)
-            log.debug("Get node config response : " + response.text)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Get node config request url : " +
+                          getnodeconfig_url)
+            response = self.__http.get(url=getnodeconfig_url)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Get node config response : " + response.text)
             response.raise_for_status()
         except requests.exceptions.SSLError:
             raise SSLError
         except requests.exceptions.ConnectionError:
             raise NetworkError
-        except Exception:
-            raise Exception(response.text)
+        except requests.exceptions.HTTPError as http_err:
+            raise Exception(http_err.response.text)
         log.info("Received node config successfully.")
-        return response.json()
+        node_config = _loads(response.content)
+        self.__store_cached_response(self._config_cache, node_config)
+        return node_config
 
     def get_node_params(self):
         """
@@ -130,27 +393,32 @@ class Node:
         :rtype: dict | None
 
         """
+        request_batcher = getattr(self.__session, 'batcher', None)
+        if request_batcher is not None:
+            return request_batcher.submit('get_params', self.__nodeid)\
+                                  .result()
+        cached = self.__get_batched_response('params')
+        if cached is not None:
+            return cached
         log.info("Getting parameters of the node with nodeid : " +
                  self.__nodeid)
-        path = 'user/nodes/params'
-        query_parameters = 'nodeid=' + self.__nodeid
-        getparams_url = serverconfig.HOST + path + '?' + query_parameters
+        getparams_url = self.__urls['params']
         try:
-            log.debug("Get node params request url : " + getparams_url)
-            response = requests.get(url=getparams_url,
-                                    headers=self.__request_header,
-                                    verify=configmanager.CERT_FILE)
-            log.debug("Get node params response : " + response.text)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Get node params request url : " + getparams_url)
+            response = self.__http.get(url=getparams_url)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Get node params response : " + response.text)
             response.raise_for_status()
         except requests.exceptions.SSLError:
             raise SSLError
         except requests.exceptions.ConnectionError:
             raise NetworkError
-        except Exception:
-            raise Exception(response.text)
+        except requests.exceptions.HTTPError as http_err:
+            raise Exception(http_err.response.text)
 
-        response = json.loads(response.text)
-        if 'status' in response and response['status'] == 'failure':
+        response = _loads_params_response(response.content)
+        if response is None:
             return None
         log.info("Received node parameters successfully.")
         return response
@@ -170,26 +438,33 @@ class Node:
         :return: True on Success
         :rtype: bool
         """
+        request_batcher = getattr(self.__session, 'batcher', None)
+        if request_batcher is not None:
+            return request_batcher.submit('set_params', self.__nodeid,
+                                          payload=data).result()
         log.info("Updating parameters of the node with nodeid : " +
                  self.__nodeid)
-        path = 'user/nodes/params'
-        query_parameters = 'nodeid=' + self.__nodeid
-        setparams_url = serverconfig.HOST + path + '?' + query_parameters
+        setparams_url = self.__urls['params']
         try:
-            log.debug("Set node params request url : " + setparams_url)
-            log.debug("Set node params request payload : " + json.dumps(data))
-            response = requests.put(url=setparams_url,
-                                    data=json.dumps(data),
-                                    headers=self.__request_header,
-                                    verify=configmanager.CERT_FILE)
-            log.debug("Set node params response : " + response.text)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Set node params request url : " + setparams_url)
+                log.debug("Set node params request payload : " +
+                          json.dumps(data))
+            response = self.__http.put(url=setparams_url,
+                                       data=_dumps(data))
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Set node params response : " + response.text)
             response.raise_for_status()
         except requests.exceptions.SSLError:
             raise SSLError
         except requests.exceptions.ConnectionError:
             raise NetworkError
-        except Exception:
-            raise Exception(response.text)
+        except requests.exceptions.HTTPError as http_err:
+            raise Exception(http_err.response.text)
+        self.invalidate_cache(self.__nodeid)
+        batch_cache = getattr(self.__session, '_batch_cache', None)
+        if batch_cache:
+            batch_cache.get('params', {}).pop(self.__nodeid, None)
         log.info("Updated node parameters successfully.")
         return True
 
@@ -213,9 +488,11 @@ class Node:
         :return: Request Id if Success, None if Failure
         :rtype: str | None
         """
-        path = 'user/nodes/mapping'
-        config = configmanager.Config()
-        userid = config.get_user_id()
+        try:
+            userid = self.__session.user_id or self.__session.load_user_id()
+        except AttributeError:
+            config = configmanager.Config()
+            userid = config.get_user_id()
         request_payload = {
             'user_id': userid,
             'node_id': self.__nodeid,
@@ -223,33 +500,29 @@ class Node:
             'operation': operation
         }
 
-        request_url = serverconfig.HOST + path
+        request_url = self.__urls['mapping']
         try:
-            log.debug("User node mapping request url : " + request_url)
-            log.debug("User node mapping request payload : " +
-                      str(request_payload))
-            response = requests.put(url=request_url,
-                                    data=json.dumps(request_payload),
-                                    headers=self.__request_header,
-                                    verify=configmanager.CERT_FILE)
-            log.debug("User node mapping response : " + response.text)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("User node mapping request url : " + request_url)
+                log.debug("User node mapping request payload : " +
+                          str(request_payload))
+            response = self.__http.put(url=request_url,
+                                       data=_dumps(request_payload))
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("User node mapping response : " + response.text)
             response.raise_for_status()
         except requests.exceptions.SSLError:
             raise SSLError
         except requests.exceptions.ConnectionError:
             raise NetworkError
-        except Exception:
-            raise Exception(response.text)
+        except requests.exceptions.HTTPError as http_err:
+            raise Exception(http_err.response.text)
 
         try:
-            response = json.loads(response.text)
+            return _response_value(response.content, 'request_id')
         except Exception as user_node_mapping_err:
             raise user_node_mapping_err
 
-        if 'request_id' in response:
-            return response['request_id']
-        return None
-
     def add_user_node_mapping(self, secret_key):
         """
         Add user node mapping.
@@ -306,18 +579,17 @@ class Node:
         """
         log.info("Checking status of user node mapping with request_id : " +
                  request_id)
-        path = 'user/nodes/mapping'
-        query_parameters = "&request_id=" + request_id
+        query_parameters = urlencode({'request_id': request_id})
 
-        request_url = serverconfig.HOST + path + '?' + query_parameters
+        request_url = self.__urls['mapping'] + '?' + query_parameters
         try:
-            log.debug("Check user node mapping status request url : " +
-                      request_url)
-            response = requests.get(url=request_url,
-                                    headers=self.__request_header,
-                                    verify=configmanager.CERT_FILE)
-            log.debug("Check user node mapping status response : " +
-                      response.text)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Check user node mapping status request url : " +
+                          request_url)
+            response = self.__http.get(url=request_url)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Check user node mapping status response : " +
+                          response.text)
             response.raise_for_status()
         except requests.exceptions.SSLError:
             raise SSLError
@@ -327,10 +599,273 @@ class Node:
             raise mapping_status_err
 
         try:
-            response = json.loads(response.text)
+            return _response_value(response.content, 'request_status')
         except Exception as mapping_status_err:
             raise mapping_status_err
 
-        if 'request_status' in response:
-            return response['request_status']
-        return None
+
+def get_nodes_status(session, node_ids):
+    """
+    Get online/offline status of multiple nodes with batched requests.
+
+    :param session: :class:`rmaker_lib.session.Session`
+    :type session: object
+
+    :param node_ids: Node Ids of nodes
+    :type node_ids: list
+
+    :raises NetworkError: If there is a network connection issue while
+                          getting node status
+    :raises Exception: If there is an HTTP issue while getting node status
+
+    :return: Status of nodes keyed by nodeid on Success
+    :rtype: dict
+    """
+    log.info("Getting online/offline status of " + str(len(node_ids)) +
+             " nodes.")
+    return _batch_request(session, 'user/nodes/status', 'status', node_ids)
+
+
+def get_nodes_config(session, node_ids):
+    """
+    Get configuration of multiple nodes with batched requests.
+
+    :param session: :class:`rmaker_lib.session.Session`
+    :type session: object
+
+    :param node_ids: Node Ids of nodes
+    :type node_ids: list
+
+    :raises NetworkError: If there is a network connection issue while
+                          getting node configuration
+    :raises Exception: If there is an HTTP issue while getting node config
+
+    :return: Configuration of nodes keyed by nodeid on Success
+    :rtype: dict
+    """
+    log.info("Getting node config of " + str(len(node_ids)) + " nodes.")
+    return _batch_request(session, 'user/nodes/config', 'config', node_ids)
+
+
+def get_nodes_params(session, node_ids):
+    """
+    Get parameters of multiple nodes with batched requests.
+
+    :param session: :class:`rmaker_lib.session.Session`
+    :type session: object
+
+    :param node_ids: Node Ids of nodes
+    :type node_ids: list
+
+    :raises NetworkError: If there is a network connection issue while
+                          getting node params
+    :raises Exception: If there is an HTTP issue while getting node params
+
+    :return: Parameters of nodes keyed by nodeid on Success
+    :rtype: dict
+    """
+    log.info("Getting node params of " + str(len(node_ids)) + " nodes.")
+    return _batch_request(session, 'user/nodes/params', 'params', node_ids)
+
+
+def set_nodes_params(session, node_params):
+    """
+    Set parameters of multiple nodes with a single request.
+
+    :param session: :class:`rmaker_lib.session.Session`
+    :type session: object
+
+    :param node_params: Parameters to be set keyed by nodeid
+    :type node_params: dict
+
+    :raises NetworkError: If there is a network connection issue while
+                          setting node params
+    :raises Exception: If there is an HTTP issue while setting node params
+                       or JSON format issue in HTTP response
+
+    :return: True on Success
+    :rtype: bool
+    """
+    log.info("Updating node params of " + str(len(node_params)) + " nodes.")
+    http_session = session.get_http_session()
+    request_url = serverconfig.HOST + 'user/nodes/params'
+    request_payload = [{'node_id': nodeid, 'payload': payload}
+                       for nodeid, payload in node_params.items()]
+    try:
+        log.debug("Set nodes params request url : " + request_url)
+        response = http_session.put(url=request_url,
+                                    data=_dumps(request_payload))
+        response.raise_for_status()
+    except requests.exceptions.SSLError:
+        raise SSLError
+    except requests.exceptions.ConnectionError:
+        raise NetworkError
+    except requests.exceptions.HTTPError as http_err:
+        raise Exception(http_err.response.text)
+    batch_cache = getattr(session, '_batch_cache', None)
+    if batch_cache:
+        for nodeid in node_params:
+            batch_cache.get('params', {}).pop(nodeid, None)
+    log.info("Updated node params successfully.")
+    return True
+
+
+def get_mapping_statuses(session, request_ids):
+    """
+    Check status of multiple user node mapping requests.
+
+    The request ids are polled concurrently over a single multiplexed
+    HTTP/2 connection when httpx (with h2) is installed, so many
+    in-flight polls share one TCP+TLS connection. They are polled
+    sequentially over the shared keep-alive session otherwise.
+
+    :param session: :class:`rmaker_lib.session.Session`
+    :type session: object
+
+    :param request_ids: Request Ids of mapping requests
+    :type request_ids: list
+
+    :raises NetworkError: If there is a network connection issue while
+                          getting user node mapping status
+    :raises Exception: If there is an HTTP issue while getting
+                       user node mapping status
+
+    :return: Request status keyed by request id on Success
+    :rtype: dict
+    """
+    request_ids = list(request_ids)
+    log.info("Checking status of " + str(len(request_ids)) +
+             " user node mapping requests.")
+    if httpx is not None:
+        try:
+            return asyncio.run(_poll_mapping_statuses(session, request_ids))
+        except ImportError:
+            log.debug("HTTP/2 support unavailable, polling sequentially.")
+    http_session = session.get_http_session()
+    result = {}
+    for request_id in request_ids:
+        request_url = (serverconfig.HOST + 'user/nodes/mapping?' +
+                       urlencode({'request_id': request_id}))
+        try:
+            response = http_session.get(url=request_url)
+            response.raise_for_status()
+        except requests.exceptions.SSLError:
+            raise SSLError
+        except requests.exceptions.ConnectionError:
+            raise NetworkError
+        except requests.exceptions.HTTPError as http_err:
+            raise Exception(http_err.response.text)
+        result[request_id] = _response_value(response.content,
+                                             'request_status')
+    return result
+
+
+async def _poll_mapping_statuses(session, request_ids):
+    """
+    Poll mapping request statuses concurrently over one HTTP/2
+    connection.
+
+    :raises NetworkError: If there is a network connection issue while
+                          getting user node mapping status
+    :raises Exception: If there is an HTTP issue while getting
+                       user node mapping status
+
+    :return: Request status keyed by request id on Success
+    :rtype: dict
+    """
+    headers = {'content-type': 'application/json',
+               'Authorization': session.id_token}
+    try:
+        async with httpx.AsyncClient(http2=True,
+                                     verify=configmanager.CERT_FILE,
+                                     headers=headers) as client:
+            responses = await asyncio.gather(
+                *[client.get(serverconfig.HOST + 'user/nodes/mapping?' +
+                             urlencode({'request_id': request_id}))
+                  for request_id in request_ids])
+    except httpx.ConnectError as connect_err:
+        if isinstance(connect_err.__cause__, ssl.SSLError):
+            raise SSLError
+        raise NetworkError
+    except httpx.TransportError:
+        raise NetworkError
+    result = {}
+    for request_id, response in zip(request_ids, responses):
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as http_err:
+            raise Exception(http_err.response.text)
+        result[request_id] = _response_value(response.content,
+                                             'request_status')
+    return result
+
+
+def _batch_request(session, path, operation, node_ids):
+    """
+    Issue GET requests for multiple nodeids at once, batched to
+    BATCH_NODEID_LIMIT nodeids per request to keep the URL length safe.
+    The per-node slices are stored in the batch cache of the session so
+    the corresponding Node methods can serve them without a round-trip.
+
+    :return: Response slices keyed by nodeid on Success
+    :rtype: dict
+    """
+    node_ids = list(node_ids)
+    http_session = session.get_http_session()
+    result = {}
+    for start in range(0, len(node_ids), BATCH_NODEID_LIMIT):
+        batch = node_ids[start:start + BATCH_NODEID_LIMIT]
+        request_url = (serverconfig.HOST + path + '?' +
+                       urlencode({'nodeid': ','.join(batch)}, safe=','))
+        try:
+            log.debug("Batch node request url : " + request_url)
+            response = http_session.get(url=request_url)
+            response.raise_for_status()
+        except requests.exceptions.SSLError:
+            raise SSLError
+        except requests.exceptions.ConnectionError:
+            raise NetworkError
+        except requests.exceptions.HTTPError as http_err:
+            raise Exception(http_err.response.text)
+        result.update(_split_batch_response(batch, _loads(response.content)))
+    if operation == 'params':
+        for nodeid, params in result.items():
+            if isinstance(params, dict) and params.get('status') == 'failure':
+                result[nodeid] = None
+    batch_cache = getattr(session, '_batch_cache', None)
+    if batch_cache is not None:
+        batch_cache.setdefault(operation, {}).update(result)
+    return result
+
+
+def _split_batch_response(node_ids, response):
+    """
+    Split a multi-node response into a dict of per-node slices. The
+    response is either keyed by nodeid directly or carries a list of
+    per-node entries that contain the nodeid.
+
+    :raises Exception: If the response shape is not recognized
+
+    :return: Response slices keyed by nodeid
+    :rtype: dict
+    """
+    if len(node_ids) == 1:
+        return {node_ids[0]: response}
+    entries = response
+    if isinstance(response, dict):
+        if any(nodeid in response for nodeid in node_ids):
+            return {nodeid: response[nodeid]
+                    for nodeid in node_ids if nodeid in response}
+        entries = response.get('node_details')
+        if entries is None:
+            entries = response.get('nodes')
+    if not isinstance(entries, list):
+        log.error("Unrecognised multi-node response : " + str(response))
+        raise Exception('Unrecognised multi-node response : ' +
+                        str(response))
+    result = {}
+    for entry in entries:
+        nodeid = entry.get('id') or entry.get('node_id')
+        if nodeid is not None:
+            result[nodeid] = entry
+    return result
@@ -14,8 +14,10 @@
 
 import requests
 import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from rmaker_lib import serverconfig, configmanager
-from rmaker_lib import node
+from rmaker_lib import batcher, node
 from rmaker_lib.exceptions import NetworkError, InvalidConfigError, SSLError
 from rmaker_lib.logger import log
 
@@ -36,6 +38,67 @@ class Session:
             raise InvalidConfigError
         self.request_header = {'content-type': 'application/json',
                                'Authorization': self.id_token}
+        self.http_session = None
+        self._batch_cache = {}
+        self.batcher = None
+        self.user_id = None
+
+    def load_user_id(self):
+        """
+        Get the User Id for this session, reading it from the saved
+        config on first use and serving it from memory afterwards.
+
+        :raises InvalidConfigError: If there is an issue in getting
+                                    user id from config
+
+        :return: User Id on Success
+        :rtype: str
+        """
+        if self.user_id is None:
+            config = configmanager.Config()
+            self.user_id = config.get_user_id()
+        return self.user_id
+
+    def get_batcher(self):
+        """
+        Get the request batcher for this session, creating it on first
+        use. While a batcher is active, node parameter reads/writes
+        issued through :class:`rmaker_lib.node.Node` are coalesced into
+        batched REST calls.
+
+        :return: Request batcher on Success
+        :rtype: :class:`rmaker_lib.batcher.RequestBatcher`
+        """
+        if self.batcher is None:
+            self.batcher = batcher.RequestBatcher(self)
+        return self.batcher
+
+    def get_http_session(self):
+        """
+        Get the shared HTTP session for REST calls.
+
+        The session keeps connections to the RainMaker host alive so that
+        all :class:`rmaker_lib.node.Node` instances created from this user
+        session reuse one connection pool instead of performing a new
+        TCP+TLS handshake per request.
+
+        :return: Shared HTTP session on Success
+        :rtype: :class:`requests.Session`
+        """
+        if self.http_session is None:
+            log.debug("Creating shared HTTP session with connection pooling.")
+            retry_policy = Retry(total=3, backoff_factor=0.2,
+                                 status_forcelist=(502, 503, 504),
+                                 allowed_methods=('GET', 'PUT'))
+            self.http_session = requests.Session()
+            self.http_session.mount('https://',
+                                    HTTPAdapter(pool_connections=4,
+                                                pool_maxsize=20,
+                                                max_retries=retry_policy))
+            self.http_session.headers.update(self.request_header)
+            self.http_session.headers['Accept-Encoding'] = 'br, gzip, deflate'
+            self.http_session.verify = configmanager.CERT_FILE
+        return self.http_session
 
     def get_nodes(self):
         """